@@ -0,0 +1,5 @@
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+def parse_side(rows: List[List[str]]) -> List[Tuple[Decimal, Decimal]]: ...
+def apply_side(parsed: List[Tuple[Decimal, Decimal]], offset: int, offsets: Dict[Decimal, int], side: Any, delta: Optional[List[Tuple[Decimal, Decimal]]]) -> bool: ...
@@ -0,0 +1,64 @@
+'''
+Copyright (C) 2017-2025 Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+cimport cython
+
+from cryptofeed.util.fast_json import to_decimal
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef list parse_side(list rows):
+    """
+    Convert dYdX [price, size] rows to a list of (Decimal, Decimal) tuples
+    """
+    cdef list ret = []
+    cdef list row
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = len(rows)
+
+    for i in range(n):
+        row = rows[i]
+        ret.append((to_decimal(row[0]), to_decimal(row[1])))
+    return ret
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef bint apply_side(list parsed, long long offset, dict offsets, object side, list delta):
+    """
+    Apply the parsed (price, amount) updates to side (an order_book SortedDict) that are not
+    older than the offset recorded for their price level. Applied updates are appended to delta,
+    unless it is None.
+
+    Returns True if any level was updated.
+    """
+    cdef bint updated = False
+    cdef tuple entry
+    cdef object price
+    cdef object amount
+    cdef object current
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = len(parsed)
+
+    for i in range(n):
+        entry = parsed[i]
+        price = entry[0]
+        amount = entry[1]
+        current = offsets.get(price)
+        if current is not None and offset < <long long>current:
+            continue
+
+        offsets[price] = offset
+        updated = True
+        if delta is not None:
+            delta.append(entry)
+        if amount == 0:
+            if price in side:
+                del side[price]
+        else:
+            side[price] = amount
+    return updated
@@ -0,0 +1,3 @@
+from typing import Any, Dict, List
+
+def update_book(obu: List[Dict[str, Any]], book: Any) -> Dict[str, List[tuple]]: ...
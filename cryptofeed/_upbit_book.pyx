@@ -0,0 +1,51 @@
+'''
+Copyright (C) 2017-2025 Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+cimport cython
+
+from cryptofeed.defines import BID, ASK
+from cryptofeed.util.fast_json import to_decimal
+
+
+cdef list update_side(object side, dict levels):
+    cdef list delta = []
+
+    for price in side.keys():
+        if price not in levels:
+            del side[price]
+            delta.append((price, 0))
+
+    for price, size in levels.items():
+        if price not in side or side[price] != size:
+            side[price] = size
+            delta.append((price, size))
+    return delta
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef dict update_book(list obu, object book):
+    """
+    Update book (an order_book.OrderBook) in place to match the levels in the Upbit
+    orderbook units (obu), removing levels that are no longer present and only writing
+    levels whose size changed. Levels with a price of 0 are skipped.
+
+    Returns the delta ({BID: [(price, size), ...], ASK: [...]}) that was applied.
+    """
+    cdef dict bids = {}
+    cdef dict asks = {}
+    cdef dict unit
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = len(obu)
+
+    for i in range(n):
+        unit = obu[i]
+        if unit['bp'] > 0:
+            bids[to_decimal(unit['bp'])] = to_decimal(unit['bs'])
+        if unit['ap'] > 0:
+            asks[to_decimal(unit['ap'])] = to_decimal(unit['as'])
+
+    return {BID: update_side(book.bids, bids), ASK: update_side(book.asks, asks)}
@@ -6,9 +6,10 @@ associated with this software.
 '''
 from collections import defaultdict
 from cryptofeed.symbols import Symbol
+from datetime import datetime as dt
 import logging
 from decimal import Decimal
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 from yapic import json
 
@@ -17,8 +18,57 @@ from cryptofeed.defines import BID, ASK, BUY, DYDX, L2_BOOK, SELL, TRADES
 from cryptofeed.feed import Feed
 from cryptofeed.exchanges.mixins.dydx_rest import dYdXRestMixin
 from cryptofeed.types import OrderBook, Trade
+from cryptofeed.util.fast_json import json_loads, to_decimal
+
+try:
+    from cryptofeed._dydx_book import apply_side, parse_side
+except ImportError:
+    # pure python fallbacks for cryptofeed._dydx_book
+    def parse_side(rows: list) -> List[Tuple[Decimal, Decimal]]:
+        return [(to_decimal(row[0]), to_decimal(row[1])) for row in rows]
+
+    def apply_side(parsed: List[Tuple[Decimal, Decimal]], offset: int, offsets: Dict[Decimal, int], side, delta: Optional[list]) -> bool:
+        valid = []
+        for price, amount in parsed:
+            if price in offsets and offset < offsets[price]:
+                continue
+            offsets[price] = offset
+            valid.append((price, amount))
+        if not valid:
+            return False
+
+        for price, amount in valid:
+            if amount == 0:
+                if price in side:
+                    del side[price]
+            else:
+                side[price] = amount
+        if delta is not None:
+            delta.extend(valid)
+        return True
 
 LOG = logging.getLogger('feedhandler')
+_DATA_MESSAGE_TYPES = frozenset({'channel_data', 'subscribed'})
+_SIDE_MAP = {'BUY': BUY, 'SELL': SELL}
+# trade messages with at least this many trades (in practice, the subscribed snapshot)
+# have their timestamps converted in a single numpy pass, when numpy is installed
+_BULK_TIMESTAMP_MIN = 5
+# numpy module, resolved on first bulk conversion; _NO_NUMPY once the import has failed
+_np = None
+_NO_NUMPY = object()
+
+
+def _numpy():
+    global _np
+    if _np is None:
+        # imported here so that importing cryptofeed does not pay for numpy
+        try:
+            import numpy
+        except ImportError:
+            _np = _NO_NUMPY
+        else:
+            _np = numpy
+    return _np
 
 
 class dYdX(Feed, dYdXRestMixin):
@@ -31,6 +81,27 @@ class dYdX(Feed, dYdXRestMixin):
         TRADES: 'v3_trades',
     }
     request_limit = 10
+    uvloop_recommended = True
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._channel_handlers = {self.std_channel_to_exchange(L2_BOOK): self._book, self.std_channel_to_exchange(TRADES): self._trade}
+
+    @classmethod
+    def timestamp_normalize(cls, ts: Union[str, dt]) -> float:
+        # yapic decodes ISO 8601 strings to datetimes, orjson leaves them as strings
+        if isinstance(ts, str):
+            ts = dt.fromisoformat(ts.replace('Z', '+00:00'))
+        return ts.timestamp()
+
+    def _trade_timestamps(self, trades: list) -> List[float]:
+        created = [trade['createdAt'] for trade in trades]
+        if len(created) >= _BULK_TIMESTAMP_MIN and all(type(ts) is str and ts[-1] == 'Z' for ts in created):
+            np = _numpy()
+            if np is not _NO_NUMPY:
+                # strip the UTC designator, numpy parses naive timestamps as UTC
+                return (np.array([ts[:-1] for ts in created], dtype='datetime64[us]').astype('int64') / 1_000_000).tolist()
+        return [self.timestamp_normalize(ts) for ts in created]
 
     @classmethod
     def _parse_symbol_data(cls, data: dict) -> Tuple[Dict, Dict]:
@@ -49,47 +120,44 @@ class dYdX(Feed, dYdXRestMixin):
 
     def __reset(self):
         self._l2_book = {}
-        self._offsets = {}
+        # per symbol (book, bids, asks, offsets), bound on each snapshot so that
+        # deltas need a single lookup
+        self._book_state = {}
 
     async def _book(self, msg: dict, timestamp: float):
-        pair = self.exchange_symbol_to_std_symbol(msg['id'])
-        delta = {BID: [], ASK: []}
+        pair = self._symbol_map.get(msg['id']) or self.exchange_symbol_to_std_symbol(msg['id'])
 
         if msg['type'] == 'channel_data':
-            updated = False
+            if self._delta_wanted:
+                delta = {BID: [], ASK: []}
+                bid_delta, ask_delta = delta[BID], delta[ASK]
+            else:
+                delta = bid_delta = ask_delta = None
+
+            book, bids, asks, offsets = self._book_state[pair]
             offset = int(msg['contents']['offset'])
-            for side, key in ((BID, 'bids'), (ASK, 'asks')):
-                for data in msg['contents'][key]:
-                    price = Decimal(data[0])
-                    amount = Decimal(data[1])
-
-                    if price in self._offsets[pair] and offset < self._offsets[pair][price]:
-                        continue
-
-                    updated = True
-                    self._offsets[pair][price] = offset
-                    delta[side].append((price, amount))
-
-                    if amount == 0:
-                        if price in self._l2_book[pair].book[side]:
-                            del self._l2_book[pair].book[side][price]
-                    else:
-                        self._l2_book[pair].book[side][price] = amount
-            if updated:
-                await self.book_callback(L2_BOOK, self._l2_book[pair], timestamp, delta=delta, raw=msg)
+            bids_updated = apply_side(parse_side(msg['contents']['bids']), offset, offsets, bids, bid_delta)
+            asks_updated = apply_side(parse_side(msg['contents']['asks']), offset, offsets, asks, ask_delta)
+            if bids_updated or asks_updated:
+                await self.book_callback(L2_BOOK, book, timestamp, delta=delta, raw=msg)
         else:
-            # snapshot
-            self._l2_book[pair] = OrderBook(self.id, pair, max_depth=self.max_depth)
-            self._offsets[pair] = {}
+            # snapshot - levels are collected into plain dicts and bulk loaded into
+            # the order_book sorted containers, which is much faster than inserting one by one
+            offsets = {}
+            levels = {BID: {}, ASK: {}}
 
             for side, data in msg['contents'].items():
-                side = BID if side == 'bids' else ASK
+                side_levels = levels[BID if side == 'bids' else ASK]
                 for entry in data:
-                    self._offsets[pair][Decimal(entry['price'])] = int(entry['offset'])
-                    size = Decimal(entry['size'])
+                    price = to_decimal(entry['price'])
+                    size = to_decimal(entry['size'])
+                    offsets[price] = int(entry['offset'])
                     if size > 0:
-                        self._l2_book[pair].book[side][Decimal(entry['price'])] = size
-            await self.book_callback(L2_BOOK, self._l2_book[pair], timestamp, delta=None, raw=msg)
+                        side_levels[price] = size
+            book = OrderBook(self.id, pair, bids=levels[BID], asks=levels[ASK], max_depth=self.max_depth)
+            self._l2_book[pair] = book
+            self._book_state[pair] = (book, book.book.bids, book.book.asks, offsets)
+            await self.book_callback(L2_BOOK, book, timestamp, delta=None, raw=msg)
 
     async def _trade(self, msg: dict, timestamp: float):
         """
@@ -133,41 +201,56 @@ class dYdX(Feed, dYdXRestMixin):
             }
         }
         """
-        pair = self.exchange_symbol_to_std_symbol(msg['id'])
-        for trade in msg['contents']['trades']:
-            t = Trade(
+        pair = self._symbol_map.get(msg['id']) or self.exchange_symbol_to_std_symbol(msg['id'])
+        data = msg['contents']['trades']
+        trades = [
+            Trade(
                 self.id,
                 pair,
-                BUY if trade['side'] == 'BUY' else SELL,
-                Decimal(trade['size']),
-                Decimal(trade['price']),
-                self.timestamp_normalize(trade['createdAt']),
+                _SIDE_MAP[trade['side']],
+                to_decimal(trade['size']),
+                to_decimal(trade['price']),
+                ts,
                 raw=trade
             )
+            for trade, ts in zip(data, self._trade_timestamps(data))
+        ]
+        # callbacks take one object at a time and must see trades in order,
+        # so they are awaited sequentially rather than gathered
+        for t in trades:
             await self.callback(TRADES, t, timestamp)
 
     async def message_handler(self, msg: str, conn: AsyncConnection, timestamp: float):
-        msg = json.loads(msg, parse_float=Decimal)
-
-        if msg['type'] == 'channel_data' or msg['type'] == 'subscribed':
-            chan = self.exchange_channel_to_std(msg['channel'])
-            if chan == L2_BOOK:
-                await self._book(msg, timestamp)
-            elif chan == TRADES:
-                await self._trade(msg, timestamp)
-            else:
-                LOG.warning("%s: unexpected channel type received: %s", self.id, msg)
-        elif msg['type'] == 'connected':
+        # prices and sizes are sent as strings, so no Decimal hook is needed
+        msg = json_loads(msg)
+        msg_type = msg['type']
+
+        if msg_type == 'connected':
             return
+
+        if msg_type in _DATA_MESSAGE_TYPES:
+            handler = self._channel_handlers.get(msg['channel'])
+            if handler is None:
+                LOG.warning("%s: unexpected channel type received: %s", self.id, msg)
+            else:
+                await handler(msg, timestamp)
         else:
             LOG.warning("%s: Invalid message type %s", self.id, msg)
 
     async def subscribe(self, conn: AsyncConnection):
         self.__reset()
 
+        # dYdX accepts a single subscription (channel + id) per websocket message, so the
+        # requests cannot be coalesced into one frame. They are all serialized up front,
+        # then sent back to back.
+        msgs = []
         for chan, symbols in self.subscription.items():
+            book = self.exchange_channel_to_std(chan) == L2_BOOK
             for symbol in symbols:
                 msg = {"type": "subscribe", "channel": chan, "id": symbol}
-                if self.exchange_channel_to_std(chan) == L2_BOOK:
+                if book:
                     msg['includeOffsets'] = True
-                await conn.write(json.dumps(msg))
+                msgs.append(json.dumps(msg))
+
+        for msg in msgs:
+            await conn.write(msg)
@@ -5,22 +5,50 @@ Please see the LICENSE file for the terms and conditions
 associated with this software.
 '''
 import logging
-from decimal import Decimal
 from typing import Dict, Tuple
 import uuid
 
 from yapic import json
 
 from cryptofeed.connection import AsyncConnection
-from cryptofeed.defines import BUY, L2_BOOK, SELL, TRADES, UPBIT
+from cryptofeed.defines import BID, ASK, BUY, L2_BOOK, SELL, TRADES, UPBIT
 from cryptofeed.feed import Feed
 from cryptofeed.symbols import Symbol
 from cryptofeed.exchanges.mixins.upbit_rest import UpbitRestMixin
 from cryptofeed.connection import WebsocketEndpoint, RestEndpoint, Routes
 from cryptofeed.types import OrderBook, Trade
+from cryptofeed.util.fast_json import json_loads, to_decimal
+
+
+def _update_side(side, levels: dict) -> list:
+    delta = []
+    for price in side.keys():
+        if price not in levels:
+            del side[price]
+            delta.append((price, 0))
+    for price, size in levels.items():
+        if price not in side or side[price] != size:
+            side[price] = size
+            delta.append((price, size))
+    return delta
+
+
+def _update_book(obu: list, book) -> dict:
+    # pure python version of cryptofeed._upbit_book.update_book
+    bids = {to_decimal(unit['bp']): to_decimal(unit['bs']) for unit in obu if unit['bp'] > 0}
+    asks = {to_decimal(unit['ap']): to_decimal(unit['as']) for unit in obu if unit['ap'] > 0}
+    return {BID: _update_side(book.bids, bids), ASK: _update_side(book.asks, asks)}
+
+
+try:
+    from cryptofeed._upbit_book import update_book
+except ImportError:
+    update_book = _update_book
 
 
 LOG = logging.getLogger('feedhandler')
+_TICKET_PLACEHOLDER = str(uuid.UUID(int=0))
+_UPBIT_SIDE = {'BID': BUY, 'ASK': SELL}
 
 
 class Upbit(Feed, UpbitRestMixin):
@@ -32,6 +60,11 @@ class Upbit(Feed, UpbitRestMixin):
         TRADES: TRADES,
     }
     request_limit = 10
+    uvloop_recommended = True
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._sub_payload = None
 
     @classmethod
     def timestamp_normalize(cls, ts: float) -> float:
@@ -70,12 +103,12 @@ class Upbit(Feed, UpbitRestMixin):
         }
         """
 
-        price = Decimal(msg['tp'])
-        amount = Decimal(msg['tv'])
+        price = to_decimal(msg['tp'])
+        amount = to_decimal(msg['tv'])
         t = Trade(
             self.id,
-            self.exchange_symbol_to_std_symbol(msg['cd']),
-            BUY if msg['ab'] == 'BID' else SELL,
+            self._symbol_map.get(msg['cd']) or self.exchange_symbol_to_std_symbol(msg['cd']),
+            _UPBIT_SIDE[msg['ab']],
             amount,
             price,
             self.timestamp_normalize(msg['ttms']),
@@ -88,7 +121,8 @@ class Upbit(Feed, UpbitRestMixin):
         """
         Doc : https://docs.upbit.com/v1.0.7/reference#시세-호가-정보orderbook-조회
 
-        Currently, Upbit orderbook api only provides 15 depth book state and does not support delta
+        Currently, Upbit orderbook api only provides 15 depth book state and does not support delta,
+        so the delta is computed against the previous book state
 
         {
             'ty': 'orderbook'       // Event type
@@ -114,23 +148,27 @@ class Upbit(Feed, UpbitRestMixin):
             'tms': 1584263923870,  // Timestamp
         }
         """
-        pair = self.exchange_symbol_to_std_symbol(msg['cd'])
+        pair = self._symbol_map.get(msg['cd']) or self.exchange_symbol_to_std_symbol(msg['cd'])
         orderbook_timestamp = self.timestamp_normalize(msg['tms'])
+        delta = None
         if pair not in self._l2_book:
             self._l2_book[pair] = OrderBook(self.id, pair, max_depth=self.max_depth)
+            update_book(msg['obu'], self._l2_book[pair].book)
+        else:
+            delta = update_book(msg['obu'], self._l2_book[pair].book)
 
-        self._l2_book[pair].book.bids = {Decimal(unit['bp']): Decimal(unit['bs']) for unit in msg['obu'] if unit['bp'] > 0}
-        self._l2_book[pair].book.asks = {Decimal(unit['ap']): Decimal(unit['as']) for unit in msg['obu'] if unit['ap'] > 0}
-
-        await self.book_callback(L2_BOOK, self._l2_book[pair], timestamp, timestamp=orderbook_timestamp, raw=msg)
+        await self.book_callback(L2_BOOK, self._l2_book[pair], timestamp, timestamp=orderbook_timestamp, delta=delta, raw=msg)
 
     async def message_handler(self, msg: str, conn, timestamp: float):
 
-        msg = json.loads(msg, parse_float=Decimal)
+        # prices and sizes are converted from floats with to_decimal, which avoids
+        # a python parse_float callback for every number in the message
+        msg = json_loads(msg)
+        msg_type = msg['ty']
 
-        if msg['ty'] == "trade":
+        if msg_type == "trade":
             await self._trade(msg, timestamp)
-        elif msg['ty'] == "orderbook":
+        elif msg_type == "orderbook":
             await self._book(msg, timestamp)
         else:
             LOG.warning("%s: Unhandled message %s", self.id, msg)
@@ -161,12 +199,16 @@ class Upbit(Feed, UpbitRestMixin):
         > [{"ticket":"UNIQUE_TICKET"},{"format":"SIMPLE"},{"type":"trade","codes":["KRW-BTC"]},{"type":"orderbook","codes":["KRW-ETH"]},{"type":"ticker", "codes":["KRW-EOS"]}]
         """
 
-        chans = [{"ticket": uuid.uuid4()}, {"format": "SIMPLE"}]
-        for chan in self.subscription:
-            codes = list(self.subscription[chan])
-            if chan == L2_BOOK:
-                chans.append({"type": "orderbook", "codes": codes, 'isOnlyRealtime': True})
-            if chan == TRADES:
-                chans.append({"type": "trade", "codes": codes, 'isOnlyRealtime': True})
-
-        await conn.write(json.dumps(chans))
+        if self._sub_payload is None:
+            # the subscription does not change between reconnects, so it is serialized once with a
+            # placeholder ticket that is swapped for a fresh one on each subscribe
+            chans = [{"ticket": _TICKET_PLACEHOLDER}, {"format": "SIMPLE"}]
+            for chan in self.subscription:
+                codes = list(self.subscription[chan])
+                if chan == L2_BOOK:
+                    chans.append({"type": "orderbook", "codes": codes, 'isOnlyRealtime': True})
+                if chan == TRADES:
+                    chans.append({"type": "trade", "codes": codes, 'isOnlyRealtime': True})
+            self._sub_payload = json.dumps(chans)
+
+        await conn.write(self._sub_payload.replace(_TICKET_PLACEHOLDER, str(uuid.uuid4()), 1))
@@ -7,6 +7,7 @@ associated with this software.
 import asyncio
 from collections import defaultdict
 import logging
+import sys
 from typing import Tuple, Callable, List, Union
 
 from aiohttp.typedefs import StrOrURL
@@ -17,6 +18,7 @@ from cryptofeed.connection_handler import ConnectionHandler
 from cryptofeed.defines import BALANCES, CANDLES, FUNDING, INDEX, L2_BOOK, L3_BOOK, LIQUIDATIONS, OPEN_INTEREST, ORDER_INFO, POSITIONS, TICKER, TRADES, FILLS
 from cryptofeed.exceptions import BidAskOverlapping
 from cryptofeed.exchange import Exchange
+from cryptofeed.nbbo import NBBO
 from cryptofeed.types import OrderBook
 
 
@@ -24,6 +26,9 @@ LOG = logging.getLogger('feedhandler')
 
 
 class Feed(Exchange):
+    # set on feeds with a high message rate, a warning is logged if they are not started on uvloop
+    uvloop_recommended = False
+
     def __init__(self, candle_interval='1m', candle_closed_only=True, timeout=120, timeout_interval=30, retries=10, symbols=None, channels=None, subscription=None, callbacks=None, max_depth=0, checksum_validation=False, cross_check=False, exceptions=None, log_message_on_error=False, delay_start=0, http_proxy: StrOrURL = None, **kwargs):
         """
         candle_interval: str
@@ -119,6 +124,9 @@ class Feed(Exchange):
             self.subscription = {chan: symbols for chan in channels}
 
         self._feed_config = dict(self._feed_config)
+        # normalized names of the subscribed exchange symbols, so message handlers can resolve
+        # them with a single dict lookup
+        self._symbol_map = {symbol: self.exchange_symbol_mapping[symbol] for symbols in self.subscription.values() for symbol in symbols if symbol in self.exchange_symbol_mapping}
         self._auth_token = None
 
         self._l3_book = {}
@@ -146,6 +154,21 @@ class Feed(Exchange):
             if not isinstance(callback, list):
                 self.callbacks[key] = [callback]
 
+        # exchanges can skip building book deltas if none of the book callbacks can use them
+        self._delta_wanted = any(self._uses_book_delta(callback) for callback in self.callbacks[L2_BOOK])
+
+    @staticmethod
+    def _uses_book_delta(callback) -> bool:
+        """
+        Returns False for book callbacks that are known to never read book.delta: unset callbacks,
+        the NBBO and backends configured with snapshots_only
+        """
+        if isinstance(callback, Callback) and callback.callback is None:
+            return False
+        if isinstance(callback, NBBO):
+            return False
+        return not getattr(callback, 'snapshots_only', False)
+
     def _connect_rest(self):
         """
         Child classes should override this method to generate connection objects that
@@ -287,6 +310,9 @@ class Feed(Exchange):
         """
         Create tasks for exchange interfaces and backends
         """
+        if self.uvloop_recommended and not sys.platform.startswith('win') and not type(loop).__module__.startswith('uvloop'):
+            LOG.warning('%s: running on %s, uvloop is recommended for this feed (see the uvloop option in docs/config.md)', self.id, type(loop).__name__)
+
         for conn, sub, handler, auth in self.connect():
             self.connection_handlers.append(ConnectionHandler(conn, sub, handler, auth, self.retries, timeout=self.timeout, timeout_interval=self.timeout_interval, exceptions=self.exceptions, log_on_error=self.log_on_error, start_delay=self.start_delay))
             self.connection_handlers[-1].start(loop)
@@ -0,0 +1,61 @@
+'''
+Copyright (C) 2017-2025 Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+
+
+JSON decoding for hot websocket handlers whose numbers do not need a Decimal hook
+(strings, or floats converted with to_decimal()). orjson is used when installed,
+otherwise yapic.
+'''
+from decimal import Decimal
+from functools import lru_cache
+
+from yapic import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+ORJSON = orjson is not None
+# prices and sizes repeat heavily across book updates, so caching the
+# conversion turns most Decimal parses into a dictionary lookup
+DECIMAL_CACHE_SIZE = 8192
+
+
+def json_loads(msg):
+    """
+    Decode a message with orjson when it is installed, otherwise with yapic. Floats are decoded
+    to python floats.
+    """
+    if ORJSON:
+        return orjson.loads(msg)
+    return json.loads(msg)
+
+
+@lru_cache(maxsize=DECIMAL_CACHE_SIZE)
+def _str_to_decimal(value: str) -> Decimal:
+    return Decimal(value)
+
+
+@lru_cache(maxsize=DECIMAL_CACHE_SIZE)
+def _float_to_decimal(value: float) -> Decimal:
+    return Decimal(repr(value))
+
+
+def to_decimal(value) -> Decimal:
+    """
+    Convert a parsed JSON number (or numeric string) to a Decimal. Floats are stringified first
+    so the Decimal matches the value sent on the wire. String and float conversions are cached.
+    """
+    vtype = type(value)
+    if vtype is str:
+        return _str_to_decimal(value)
+    if vtype is float:
+        return _float_to_decimal(value)
+    if vtype is Decimal:
+        return value
+    return Decimal(value)
@@ -39,13 +39,21 @@ define_macros = []
 # verify value at runtime with cryptofeed.types.COMPILED_WITH_ASSERTIONS
 define_macros.append(('CYTHON_WITHOUT_ASSERTIONS', None))
 
-extension = Extension("cryptofeed.types", ["cryptofeed/types.pyx"],
-                      extra_compile_args=extra_compile_args,
-                      define_macros=define_macros)
+extensions = [
+    Extension("cryptofeed.types", ["cryptofeed/types.pyx"],
+              extra_compile_args=extra_compile_args,
+              define_macros=define_macros),
+    Extension("cryptofeed._upbit_book", ["cryptofeed/_upbit_book.pyx"],
+              extra_compile_args=extra_compile_args,
+              define_macros=define_macros),
+    Extension("cryptofeed._dydx_book", ["cryptofeed/_dydx_book.pyx"],
+              extra_compile_args=extra_compile_args,
+              define_macros=define_macros),
+]
 
 setup(
     name="cryptofeed",
-    ext_modules=cythonize([extension], language_level=3, force=True),
+    ext_modules=cythonize(extensions, language_level=3, force=True),
     version="2.4.1",
     author="Bryant Moscon",
     author_email="bmoscon@gmail.com",
@@ -90,6 +98,7 @@ setup(
         "gcp_pubsub": ["google_cloud_pubsub>=2.4.1", "gcloud_aio_pubsub"],
         "kafka": ["aiokafka>=0.7.0"],
         "mongo": ["motor"],
+        "orjson": ["orjson"],
         "postgres": ["asyncpg"],
         "quasardb": ["quasardb", "numpy"],
         "rabbit": ["aio_pika", "pika"],
@@ -101,6 +110,7 @@ setup(
             "gcloud_aio_pubsub",
             "aiokafka>=0.7.0",
             "motor",
+            "orjson",
             "asyncpg",
             "aio_pika",
             "pika",
@@ -0,0 +1,112 @@
+'''
+Copyright (C) 2017-2025 Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+from decimal import Decimal
+
+import pytest
+from yapic import json
+
+from cryptofeed.backends.socket import BookSocket
+from cryptofeed.callback import Callback
+from cryptofeed.defines import ASK, BID, DYDX, L2_BOOK, TRADES
+from cryptofeed.exchanges import dYdX, dydx
+from cryptofeed.nbbo import NBBO
+from cryptofeed.symbols import Symbols
+
+
+@pytest.fixture
+def dydx_symbols():
+    Symbols.clear()
+    Symbols.set(DYDX, {'ETH-USD': 'ETH-USD'}, {'instrument_type': {'ETH-USD': 'perpetual'}, 'tick_size': {'ETH-USD': '0.1'}})
+    yield
+    Symbols.clear()
+
+
+def test_trade_timestamps_bulk(dydx_symbols, monkeypatch):
+    pytest.importorskip('numpy')
+    feed = dYdX(symbols=['ETH-USD'], channels=[TRADES])
+    created = ['2021-10-28T18:03:50.620Z', '2021-10-28T18:03:50.62Z', '2021-10-28T18:03:51.001234Z', '2021-10-28T18:04:00Z', '2021-10-28T18:04:01.5Z']
+    trades = [{'createdAt': ts} for ts in created]
+
+    expected = [dYdX.timestamp_normalize(ts) for ts in created]
+
+    def per_trade(ts):
+        raise AssertionError("timestamps should be converted in bulk")
+
+    monkeypatch.setattr(feed, 'timestamp_normalize', per_trade)
+    assert feed._trade_timestamps(trades) == expected
+
+
+def test_trade_timestamps_without_numpy(dydx_symbols, monkeypatch):
+    monkeypatch.setattr(dydx, '_np', dydx._NO_NUMPY)
+    feed = dYdX(symbols=['ETH-USD'], channels=[TRADES])
+    created = ['2021-10-28T18:03:50.620Z', '2021-10-28T18:03:50.62Z', '2021-10-28T18:03:51.001234Z', '2021-10-28T18:04:00Z', '2021-10-28T18:04:01.5Z']
+    trades = [{'createdAt': ts} for ts in created]
+
+    assert feed._trade_timestamps(trades) == [dYdX.timestamp_normalize(ts) for ts in created]
+    assert dydx._np is dydx._NO_NUMPY
+
+
+class SnapshotRecorder:
+    snapshots_only = True
+
+    def __init__(self):
+        self.books = []
+
+    async def __call__(self, book, receipt_timestamp):
+        self.books.append((book.delta, book.book.to_dict()))
+
+
+class MockConnection:
+    def __init__(self):
+        self.sent = []
+
+    async def write(self, msg):
+        self.sent.append(msg)
+
+
+async def book_cb(book, receipt_timestamp):
+    pass
+
+
+@pytest.mark.parametrize("callback, wanted", [
+    (Callback(None), False),
+    (NBBO(None, ['ETH-USD']), False),
+    (BookSocket('udp://127.0.0.1', port=12345, snapshots_only=True), False),
+    (BookSocket('udp://127.0.0.1', port=12345), True),
+    (book_cb, True),
+])
+def test_delta_wanted(dydx_symbols, callback, wanted):
+    feed = dYdX(symbols=['ETH-USD'], channels=[L2_BOOK], callbacks={L2_BOOK: callback})
+    assert feed._delta_wanted is wanted
+
+
+def test_book_without_delta(dydx_symbols):
+    recorder = SnapshotRecorder()
+    feed = dYdX(symbols=['ETH-USD'], channels=[L2_BOOK], callbacks={L2_BOOK: recorder})
+    assert feed._delta_wanted is False
+
+    messages = [
+        {'type': 'subscribed', 'id': 'ETH-USD', 'channel': 'v3_orderbook', 'contents': {
+            'bids': [{'price': '4213.5', 'size': '7.216', 'offset': '100'}],
+            'asks': [{'price': '4217.3', 'size': '1.5', 'offset': '100'}]}},
+        {'type': 'channel_data', 'id': 'ETH-USD', 'channel': 'v3_orderbook', 'contents': {
+            'offset': '101', 'bids': [['4213.5', '0'], ['4213.1', '2']], 'asks': []}},
+    ]
+
+    async def run():
+        conn = MockConnection()
+        await feed.subscribe(conn)
+        for msg in messages:
+            await feed.message_handler(json.dumps(msg), conn, 1635444230.0)
+
+    asyncio.run(run())
+
+    assert recorder.books == [
+        (None, {BID: {Decimal('4213.5'): Decimal('7.216')}, ASK: {Decimal('4217.3'): Decimal('1.5')}}),
+        (None, {BID: {Decimal('4213.1'): Decimal('2')}, ASK: {Decimal('4217.3'): Decimal('1.5')}}),
+    ]
@@ -0,0 +1,71 @@
+'''
+Copyright (C) 2017-2025 Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+from decimal import Decimal
+
+import pytest
+from yapic import json
+
+from cryptofeed.defines import ASK, BID, L2_BOOK, UPBIT
+from cryptofeed.exchanges import Upbit
+from cryptofeed.exchanges.upbit import _update_book
+from cryptofeed.symbols import Symbols
+from cryptofeed.types import OrderBook
+
+
+FIRST = [{'ap': 6727000.0, 'as': 0.4744314, 'bp': 6721000.0, 'bs': 0.0014551},
+         {'ap': 6728000.0, 'as': 1.85862302, 'bp': 6719000.0, 'bs': 0.00926683},
+         {'ap': 6729000.0, 'as': 5.43556558, 'bp': 6718000.0, 'bs': 0.40908977}]
+# 6719000 bid removed, 6721000 bid size changed, 6727000 and 6728000 asks unchanged,
+# 6729000 ask removed and an empty bid level
+SECOND = [{'ap': 6727000.0, 'as': 0.4744314, 'bp': 6721000.0, 'bs': 0.5},
+          {'ap': 6728000.0, 'as': 1.85862302, 'bp': 6718000.0, 'bs': 0.40908977},
+          {'ap': 6730000.0, 'as': 1.0, 'bp': 0, 'bs': 0}]
+
+
+def update_book_impls():
+    impls = [_update_book]
+    try:
+        from cryptofeed._upbit_book import update_book
+        impls.append(update_book)
+    except ImportError:
+        pass
+    return impls
+
+
+@pytest.mark.parametrize("update_book", update_book_impls())
+def test_update_book_delta(update_book):
+    book = OrderBook(UPBIT, 'BTC-KRW').book
+    update_book(FIRST, book)
+
+    delta = update_book(SECOND, book)
+    assert delta == {
+        BID: [(Decimal('6719000'), 0), (Decimal('6721000'), Decimal('0.5'))],
+        ASK: [(Decimal('6729000'), 0), (Decimal('6730000'), Decimal('1'))],
+    }
+    assert book.to_dict() == {
+        BID: {Decimal('6721000'): Decimal('0.5'), Decimal('6718000'): Decimal('0.40908977')},
+        ASK: {Decimal('6727000'): Decimal('0.4744314'), Decimal('6728000'): Decimal('1.85862302'), Decimal('6730000'): Decimal('1')},
+    }
+
+
+def test_upbit_first_book_has_no_delta():
+    Symbols.clear()
+    Symbols.set(UPBIT, {'BTC-KRW': 'KRW-BTC'}, {'instrument_type': {'BTC-KRW': 'spot'}})
+    deltas = []
+
+    async def book(b, receipt_timestamp):
+        deltas.append(b.delta)
+
+    feed = Upbit(symbols=['BTC-KRW'], channels=[L2_BOOK], callbacks={L2_BOOK: book})
+    for obu in (FIRST, SECOND):
+        msg = json.dumps({'ty': 'orderbook', 'cd': 'KRW-BTC', 'obu': obu, 'st': 'REALTIME', 'tms': 1584263923870})
+        asyncio.run(feed.message_handler(msg, None, 1584263924.0))
+    Symbols.clear()
+
+    assert deltas[0] is None
+    assert deltas[1][BID] == [(Decimal('6719000'), 0), (Decimal('6721000'), Decimal('0.5'))]
@@ -4,8 +4,12 @@ Copyright (C) 2017-2025 Bryant Moscon - bmoscon@gmail.com
 Please see the LICENSE file for the terms and conditions
 associated with this software.
 '''
+from decimal import Decimal
+
 from cryptofeed.defines import BID, ASK
 from cryptofeed.util.book import book_delta
+from cryptofeed.util import fast_json
+from cryptofeed.util.fast_json import json_loads, to_decimal
 
 
 def test_book_delta_simple():
@@ -55,3 +59,24 @@ def test_book_delta_empty():
 
     assert book_delta(a, b) == {'bid': [(0.9, 0), (1.0, 0), (0.8, 0)], 'ask': [(1.2, 0), (1.1, 0), (1.3, 0)]}
     assert book_delta(b, a) == {'ask': [(1.2, 0.6), (1.1, 1.1), (1.3, 2.1)], 'bid': [(0.9, 0.5), (1.0, 1), (0.8, 2)]}
+
+
+def test_to_decimal():
+    assert str(to_decimal('0.2334')) == '0.2334'
+    assert str(to_decimal(6759000.0)) == '6759000.0'
+    assert str(to_decimal(0.03243003)) == '0.03243003'
+    assert to_decimal(5) == Decimal(5)
+
+    d = Decimal('1.10')
+    assert to_decimal(d) is d
+    # cached conversions return the same object
+    assert to_decimal('17.23') is to_decimal('17.23')
+
+
+def test_json_loads(monkeypatch):
+    msg = '{"ty": "orderbook", "obu": [{"ap": 0.03243003, "as": 1}]}'
+    expected = {'ty': 'orderbook', 'obu': [{'ap': 0.03243003, 'as': 1}]}
+    assert json_loads(msg) == expected
+
+    monkeypatch.setattr(fast_json, 'ORJSON', False)
+    assert json_loads(msg) == expected